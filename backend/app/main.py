@@ -2,7 +2,9 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
+import logging
 import os
+import sys
 import uvicorn
 
 
@@ -27,9 +29,8 @@ app.add_middleware(
 
 
 
-os.makedirs("./data/uploads/jds", exist_ok=True)
-os.makedirs("./data/uploads/resumes", exist_ok=True)
-os.makedirs("./data/processed", exist_ok=True)
+for path in ("./data/uploads/jds", "./data/uploads/resumes", "./data/processed"):
+    os.makedirs(path, exist_ok=True)
 
 
 
@@ -172,14 +173,19 @@ async def not_found_handler(request, exc):
 
 #Main entry point
 if __name__ == "__main__":
-    print("\n" + "=" * 70)
-    print("🚀 Starting SentientGeeks ATS Resume Matcher API...")
-    print("=" * 70)
+    # uvicorn keeps its own log config here: the reloaded worker process
+    # imports this module fresh and would not inherit a root logging setup
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    logging.getLogger(__name__).info(f"\n{'=' * 70}\n🚀 Starting SentientGeeks ATS Resume Matcher API...\n{'=' * 70}")
     uvicorn.run(
-        app,
+        "backend.app.main:app",  # reload needs an import string, not the app object
         host="0.0.0.0",
         port=8000,
         log_level="info",
         reload=True,
-        limit_max_request_size=500 * 1024 * 1024  # Ensures 500MB limit in Uvicorn too
+        reload_dirs=["backend"],
+        reload_excludes=["data/*", "*.db", "*.sqlite*", "__pycache__/*"],
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # no uvloop on Windows
+        http="httptools",
+        workers=1
     )
@@ -160,7 +160,7 @@ class EnhancedAgenticATSService:
             process=Process.sequential
         )
     
-        result = crew.kickoff()
+        result = await crew.kickoff_async()
         parsed_result = self._parse_json_result(result, "resume analysis")
     
         # POST-PROCESSING: Ensure skills is always an array
@@ -219,7 +219,7 @@ class EnhancedAgenticATSService:
             process=Process.sequential
         )
     
-        result = crew.kickoff()
+        result = await crew.kickoff_async()
         return self._parse_json_result(result, "job description analysis")
     
     async def match_and_score(self, jd_data: Dict[str, Any], resume_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -272,7 +272,7 @@ class EnhancedAgenticATSService:
         )
         
         try:
-            result = crew.kickoff()
+            result = await crew.kickoff_async()
             scoring_data = self._parse_json_result(result, "matching and scoring")
             
             # Ensure required fields exist
@@ -385,7 +385,7 @@ class EnhancedAgenticATSService:
     
         try:
             print("🚀 Executing refinement crew...")
-            result = crew.kickoff()
+            result = await crew.kickoff_async()
             result_str = str(result)
         
             # Try to parse as JSON directly
@@ -14,6 +14,7 @@ class OllamaService:
         self.base_url = settings.OLLAMA_BASE_URL.rstrip('/')
         self.model = settings.OLLAMA_MODEL
         self.timeout = settings.OLLAMA_TIMEOUT
+        self._session = None
         
         # Verify configuration
         if not self.base_url or self.base_url == "":
@@ -24,6 +25,14 @@ class OllamaService:
         
         print(f"✅ OllamaService initialized: {self.base_url} | Model: {self.model}")
     
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive HTTP session shared by every call, created on first use"""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({"Content-Type": "application/json"})
+        return self._session
+    
     def _make_request(self, prompt: str, system_prompt: str = None, temperature: float = 0.2) -> str:
         """
         Make a request to Ollama inference endpoint
@@ -58,11 +67,10 @@ class OllamaService:
             print(f"   Prompt Length: {len(prompt)} chars")
             
             # Make request
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
-                timeout=self.timeout,
-                headers={"Content-Type": "application/json"}
+                timeout=self.timeout
             )
             
             response.raise_for_status()
@@ -246,7 +254,7 @@ Return the updated structure:
     
     def health_check(self) -> bool:
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/tags",
                 timeout=5
             )
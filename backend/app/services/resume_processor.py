@@ -1,78 +1,269 @@
-import PyPDF2
 import re
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 import io
+import os
+import sys
 import traceback
 
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+    import PyPDF2
+
+import ahocorasick
+
+
+def _is_word_boundary(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end + 1] is not part of a longer word"""
+    before_ok = start == 0 or not (text[start - 1].isalnum() or text[start - 1] == '_')
+    after_ok = end + 1 == len(text) or not (text[end + 1].isalnum() or text[end + 1] == '_')
+    return before_ok and after_ok
+
+
+# Fallback delimiters tried, in priority order, when a skills string has no
+# commas; only the first one present is split on, so "scikit-learn" survives
+# a "|"-separated list
+_SKILL_DELIMITERS = ('|', ';', '/', '\n', '•', '-')
+
+
+def _normalize_skill_list(skills: list) -> List[str]:
+    """Clean a list of skills"""
+    return [str(skill).strip() for skill in skills if skill and str(skill).strip()]
+
+
+def _normalize_skill_dict(skills: dict) -> List[str]:
+    """Flatten dictionary skills (e.g., {0: "Python", 1: "Java"})"""
+    return [str(v).strip() for v in skills.values() if v and str(v).strip()]
+
+
+def _normalize_skill_str(skills: str) -> List[str]:
+    """Split a delimited skills string"""
+    # Try splitting by comma first
+    skill_list = [s.strip() for s in skills.split(',') if s.strip()]
+    
+    # If no commas found, try other delimiters
+    if len(skill_list) == 1:
+        for delimiter in _SKILL_DELIMITERS:
+            if delimiter in skills:
+                skill_list = [s.strip() for s in skills.split(delimiter) if s.strip()]
+                break
+    
+    return skill_list
+
+
+def _normalize_skill_other(skills) -> List[str]:
+    """Convert any other value to a single-item list"""
+    try:
+        skill_str = str(skills).strip()
+        return [skill_str] if skill_str else []
+    except:
+        return []
+
+
+# Exact-type dispatch for normalize_skills_to_array
+_SKILL_NORMALIZERS = {
+    list: _normalize_skill_list,
+    dict: _normalize_skill_dict,
+    str: _normalize_skill_str,
+    type(None): lambda _: []
+}
+
+
+def _skill_normalizer_for(skills):
+    """Pick the normalizer for skills; subclasses (e.g. OrderedDict) miss the
+    exact-type table and fall back to isinstance checks"""
+    normalizer = _SKILL_NORMALIZERS.get(type(skills))
+    if normalizer is not None:
+        return normalizer
+    for base in (list, dict, str):
+        if isinstance(skills, base):
+            return _SKILL_NORMALIZERS[base]
+    return _normalize_skill_other
+
+
 
 class ResumeProcessor:
-    def __init__(self):
-        self.experience_indicators = [
-            'experience', 'work history', 'employment', 'professional experience',
-            'career history', 'work experience', 'employment history'
-        ]
-        
-        self.skill_categories = {
-            'programming': [
-                'python', 'java', 'javascript', 'c++', 'c#', 'go', 'rust', 'php',
-                'ruby', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl'
-            ],
-            'web_frameworks': [
-                'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
-                'express', 'laravel', 'rails', 'asp.net', 'node.js', 'next.js'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle',
-                'cassandra', 'elasticsearch', 'dynamodb', 'mariadb'
-            ],
-            'cloud': [
-                'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean',
-                'linode', 'cloudflare', 'firebase'
-            ],
-            'devops': [
-                'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
-                'terraform', 'ansible', 'puppet', 'chef', 'vagrant'
-            ],
-            'tools': [
-                'jira', 'postman', 'swagger', 'figma', 'photoshop', 'vs code',
-                'intellij', 'eclipse', 'xcode', 'android studio'
-            ],
-            'web_tech': [
-                'html', 'css', 'bootstrap', 'tailwind', 'sass', 'less',
-                'webpack', 'babel', 'typescript', 'jquery'
-            ],
-            'mobile': [
-                'android', 'ios', 'react native', 'flutter', 'xamarin', 'cordova'
-            ],
-            'data': [
-                'pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn',
-                'matplotlib', 'seaborn', 'jupyter', 'tableau', 'power bi'
-            ]
-        }
-        
-        self.company_indicators = [
-            r'[A-Z][a-zA-Z\s&.,]+(?:Pvt\.?\s*Ltd\.?|Private\s+Limited)',
-            r'[A-Z][a-zA-Z\s&.,]+(?:Inc\.?|Corporation|Corp\.?)',
-            r'[A-Z][a-zA-Z\s&.,]+(?:LLC|LLP)',
-            r'[A-Z][a-zA-Z\s&.,]+(?:Technologies|Systems|Solutions|Software)',
-            r'[A-Z][a-zA-Z\s&.,]+(?:Company|Group|Enterprises)'
+    # Pattern tables are read-only and shared by every instance
+    experience_indicators = [
+        'experience', 'work history', 'employment', 'professional experience',
+        'career history', 'work experience', 'employment history'
+    ]
+    
+    skill_categories = {
+        'programming': [
+            'python', 'java', 'javascript', 'c++', 'c#', 'go', 'rust', 'php',
+            'ruby', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl'
+        ],
+        'web_frameworks': [
+            'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
+            'express', 'laravel', 'rails', 'asp.net', 'node.js', 'next.js'
+        ],
+        'databases': [
+            'mysql', 'postgresql', 'mongodb', 'redis', 'sqlite', 'oracle',
+            'cassandra', 'elasticsearch', 'dynamodb', 'mariadb'
+        ],
+        'cloud': [
+            'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'digitalocean',
+            'linode', 'cloudflare', 'firebase'
+        ],
+        'devops': [
+            'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab',
+            'terraform', 'ansible', 'puppet', 'chef', 'vagrant'
+        ],
+        'tools': [
+            'jira', 'postman', 'swagger', 'figma', 'photoshop', 'vs code',
+            'intellij', 'eclipse', 'xcode', 'android studio'
+        ],
+        'web_tech': [
+            'html', 'css', 'bootstrap', 'tailwind', 'sass', 'less',
+            'webpack', 'babel', 'typescript', 'jquery'
+        ],
+        'mobile': [
+            'android', 'ios', 'react native', 'flutter', 'xamarin', 'cordova'
+        ],
+        'data': [
+            'pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn',
+            'matplotlib', 'seaborn', 'jupyter', 'tableau', 'power bi'
         ]
-        
-        self.role_indicators = [
-            'engineer', 'developer', 'programmer', 'analyst', 'manager',
-            'lead', 'senior', 'junior', 'intern', 'consultant', 'architect',
-            'specialist', 'coordinator', 'administrator'
+    }
+    
+    role_indicators = [
+        'engineer', 'developer', 'programmer', 'analyst', 'manager',
+        'lead', 'senior', 'junior', 'intern', 'consultant', 'architect',
+        'specialist', 'coordinator', 'administrator'
+    ]
+    
+    # Each start format shares one pattern for both a closed range and an
+    # open-ended "- Present" range
+    duration_patterns = [
+        r'(\w+\s+\d{4})\s*[-–]\s*(\w+\s+\d{4}|present)',  # "Jan 2020 - Dec 2022", "Jan 2020 - Present"
+        r'(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4}|present)',  # "01/2020 - 12/2022", "01/2020 - Present"
+        r'(\d{4})\s*[-–]\s*(\d{4}|present)',  # "2020 - 2022", "2020 - Present"
+    ]
+    
+    degree_patterns = [
+        r'(bachelor(?:\'s)?|b\.?tech|b\.?e\.?|b\.?sc|ba|bs)\s+(?:of|in|degree)?\s*([a-z\s]+)',
+        r'(master(?:\'s)?|m\.?tech|m\.?e\.?|m\.?sc|ma|ms|mba)\s+(?:of|in|degree)?\s*([a-z\s]+)',
+        r'(phd|ph\.d\.|doctorate|doctor)\s+(?:of|in)?\s*([a-z\s]+)',
+        r'(diploma|associate)\s+(?:in)?\s*([a-z\s]+)'
+    ]
+    
+    university_patterns = [
+        r'([A-Z][a-zA-Z\s]+(?:University|College|Institute)[a-zA-Z\s]*)',
+    ]
+    
+    certification_patterns = [
+        r'(aws\s+certified\s+[a-z\s\-]+(?:associate|professional|specialty)?)',
+        r'(microsoft\s+certified\s+[a-z\s\-]+)',
+        r'(google\s+cloud\s+[a-z\s\-]+(?:engineer|architect)?)',
+        r'(oracle\s+certified\s+[a-z\s\-]+)',
+        r'(cisco\s+certified\s+[a-z\s\-]+)',
+        r'(comptia\s+[a-z+]+)',
+        r'(certified\s+kubernetes\s+[a-z\s]+)',
+        r'(pmp|prince2|itil|cissp|ceh|ccna|ccnp|mcsa|mcse|rhce|cka|ckad)\s*(?:certified)?',
+    ]
+    
+    # (keywords, pattern) pairs: a pattern can only match when one of its
+    # literal keywords is in the text, which is checked before the DOTALL scan.
+    # Section bodies and header lookaheads are bounded so the scan stays
+    # linear even on long single-line text
+    skills_section_patterns = [
+        (('skills', 'technologies', 'stack', 'competencies'),
+         r'(?:technical\s+skills|skills|technologies|tech\s+stack|core\s+competencies)[:\s]+(.{0,5000}?)(?=\n\n|\n[A-Z][A-Z\s]{0,40}:|\Z)'),
+        (('languages',),
+         r'(?:programming\s+languages|languages)[:\s]+(.{0,5000}?)(?=\n\n|\n[A-Z][A-Z\s]{0,40}:|\Z)'),
+        (('tools',),
+         r'(?:tools\s+and\s+technologies|tools)[:\s]+(.{0,5000}?)(?=\n\n|\n[A-Z][A-Z\s]{0,40}:|\Z)')
+    ]
+    
+    def __init__(self):
+        # Flat skill list, so skills are enumerated in one loop. Skills are
+        # interned so skill lists across many parsed resumes share the same
+        # string objects
+        self._all_skills: List[str] = [
+            sys.intern(skill)
+            for skill_list in self.skill_categories.values()
+            for skill in skill_list
         ]
         
-        self.duration_patterns = [
-            r'(\w+\s+\d{4})\s*[-–]\s*(\w+\s+\d{4})',  # "Jan 2020 - Dec 2022"
-            r'(\d{1,2}/\d{4})\s*[-–]\s*(\d{1,2}/\d{4})',  # "01/2020 - 12/2022"
-            r'(\d{4})\s*[-–]\s*(\d{4})',  # "2020 - 2022"
-            r'(\w+\s+\d{4})\s*[-–]\s*present',  # "Jan 2020 - Present"
-            r'(\d{1,2}/\d{4})\s*[-–]\s*present',  # "01/2020 - Present"
-            r'(\d{4})\s*[-–]\s*present',  # "2020 - Present"
+        # Lower-cased catalogue for splitting space-separated runs of skills,
+        # plus the most words any catalogue skill spans
+        self._known_skills = frozenset(skill.lower() for skill in self._all_skills)
+        self._max_skill_words = max(len(skill.split()) for skill in self._known_skills)
+        
+        # A line sharing no character with the first letters of the known
+        # skills cannot mention any of them
+        self._skill_first_chars = frozenset(skill[0] for skill in self._all_skills)
+        
+        # Multi-pattern automaton finding every known skill in one pass over
+        # the text. It reports overlapping matches too ("react native" also
+        # yields "react"), as the per-skill scan it replaced did
+        self._skill_automaton = ahocorasick.Automaton()
+        for skill in self._all_skills:
+            self._skill_automaton.add_word(skill.lower(), skill)
+        self._skill_automaton.make_automaton()
+        
+        # Regexes are compiled once here so the hot paths never go through
+        # the re module's pattern cache
+        
+        # All duration patterns fused into one alternation so a line is scanned once
+        self._duration_union_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.duration_patterns), re.IGNORECASE
+        )
+        # Every duration pattern contains a year, so lines without a digit
+        # can be rejected before running the fused pattern
+        self._duration_trigger_re = re.compile(r'\d')
+        # Every component of a duration string, found in one left-to-right pass
+        self._duration_parts_re = re.compile(
+            r'(?P<years>\d+(?:\.\d+)?)\s*years?'
+            r'|(?P<months>\d+)\s*months?'
+            r'|(?P<my_month>\d{1,2})/(?P<my_year>\d{4})'
+            r'|\b(?P<year>\d{4})\b'
+            r'|(?P<present>present|current)'
+        )
+        
+        self._whitespace_re = re.compile(r'\s+')
+        
+        self._email_re = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        self._phone_re = re.compile(r'[\+]?[1-9]?[\s\-]?[\(]?[0-9]{3}[\)]?[\s\-]?[0-9]{3}[\s\-]?[0-9]{4,6}')
+        self._linkedin_re = re.compile(r'linkedin\.com/in/[\w\-]+')
+        self._github_re = re.compile(r'github\.com/[\w\-]+')
+        
+        self._degree_res = [re.compile(p, re.IGNORECASE) for p in self.degree_patterns]
+        self._university_res = [re.compile(p) for p in self.university_patterns]
+        self._edu_section_re = re.compile(
+            r'education.*?(?:experience|skills|certifications|projects|achievements|$)', re.DOTALL
+        )
+        self._year_only_re = re.compile(r'^\d{4}(-\d{4})?$')
+        
+        self._certification_res = [re.compile(p, re.IGNORECASE) for p in self.certification_patterns]
+        self._cert_section_re = re.compile(
+            r'certifications?.*?(?:education|experience|skills|projects|achievements|languages|$)', re.DOTALL
+        )
+        self._cert_header_re = re.compile(r'^certifications?:?$')
+        
+        # Bullet points or common responsibility verbs
+        self._responsibility_re = re.compile(
+            r'[•◦\-*→]|\b(?:developed|built|created|designed|implemented|managed|led|'
+            r'coordinated|maintained|optimized|collaborated|worked|responsible|achieved)\b'
+        )
+        
+        self._at_re = re.compile(r'(.+?)\s+at\s+(.+?)(?:\s*,|\s*$)', re.IGNORECASE)
+        self._dash_re = re.compile(r'(.+?)\s*[-–]\s*(.+?)(?:\s*,|\s*$)')
+        
+        self._skills_section_res = [
+            (keywords, re.compile(p, re.IGNORECASE | re.DOTALL))
+            for keywords, p in self.skills_section_patterns
         ]
+        # Skill token inside a skills section: space-separated words on one
+        # line, up to the next delimiter; _split_skill_run breaks it up
+        self._skill_token_re = re.compile(r'[\w+#.]+(?:[^\S\n]+[\w+#.]+)*')
+        self._tech_stack_re = re.compile(r'tech\s+stack[:\s]+(.{0,5000}?)(?=\n\n|\n[A-Z]|\Z)', re.IGNORECASE | re.DOTALL)
+        self._tech_stack_split_re = re.compile(r'[,|;•\-\n]+')
     
     def extract_text_from_pdf(self, file_content: bytes) -> str:
         """
@@ -85,21 +276,17 @@ class ResumeProcessor:
             Extracted text string
         """
         try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-            text = ""
-            
-            for page_num, page in enumerate(pdf_reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                except Exception as e:
-                    print(f"Error extracting page {page_num}: {e}")
-                    continue
+            # Pages are extracted in order on this thread: neither MuPDF nor
+            # PyPDF2 page objects may be shared across threads, and
+            # process_batch already spreads whole resumes over every core.
+            # Joining once keeps accumulation linear in the document size
+            text = '\n'.join(
+                page_text for page_text in self._iter_page_texts(file_content) if page_text
+            )
             
-            # Clean up the text
-            text = re.sub(r'\n+', '\n', text)  # Remove multiple newlines
-            text = re.sub(r'\s+', ' ', text)   # Remove multiple spaces
+            # Clean up the text: collapse every whitespace run (newlines
+            # included) to a single space in one pass
+            text = self._whitespace_re.sub(' ', text)
             
             return text.strip()
             
@@ -108,6 +295,49 @@ class ResumeProcessor:
             traceback.print_exc()
             return ""
     
+    def _iter_page_texts(self, file_content: bytes) -> Iterator[str]:
+        """Yield the text of each page in order, from a single open document"""
+        if fitz is not None:
+            # PyMuPDF extracts text in C, far faster than PyPDF2, and loads
+            # each page only when iteration reaches it
+            with fitz.open(stream=file_content, filetype='pdf') as pdf_doc:
+                for page_num, page in enumerate(pdf_doc):
+                    yield self._extract_page_text(page, page_num)
+        else:
+            # BytesIO shares the caller's buffer rather than copying it, and
+            # PdfReader.pages resolves each page lazily
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+            for page_num, page in enumerate(pdf_reader.pages):
+                yield self._extract_page_text(page, page_num)
+    
+    def _extract_page_text(self, page, page_num: int) -> str:
+        """Extract one page's text; a failing page is logged and skipped"""
+        try:
+            if fitz is not None:
+                return page.get_text('text')
+            return page.extract_text()
+        except Exception as e:
+            print(f"Error extracting page {page_num}: {e}")
+            return ''
+    
+    @classmethod
+    def process_batch(cls, file_contents: List[bytes]) -> List[Dict]:
+        """
+        Extract and parse a batch of resumes across all CPU cores
+        
+        Args:
+            file_contents: List of PDF files as bytes
+            
+        Returns:
+            List of resume data dictionaries, in the same order as the input
+        """
+        if not file_contents:
+            return []
+        
+        max_workers = min(os.cpu_count() or 1, len(file_contents))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_process_one, file_contents, chunksize=4))
+    
     def extract_education_details(self, text: str) -> List[str]:
         """
         Extract education information with enhanced parsing
@@ -121,17 +351,9 @@ class ResumeProcessor:
         education = []
         text_lower = text.lower()
         
-        # Degree patterns with field of study
-        degree_patterns = [
-            r'(bachelor(?:\'s)?|b\.?tech|b\.?e\.?|b\.?sc|ba|bs)\s+(?:of|in|degree)?\s*([a-z\s]+)',
-            r'(master(?:\'s)?|m\.?tech|m\.?e\.?|m\.?sc|ma|ms|mba)\s+(?:of|in|degree)?\s*([a-z\s]+)',
-            r'(phd|ph\.d\.|doctorate|doctor)\s+(?:of|in)?\s*([a-z\s]+)',
-            r'(diploma|associate)\s+(?:in)?\s*([a-z\s]+)'
-        ]
-        
         # Extract degree + field combinations
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
+        for degree_re in self._degree_res:
+            matches = degree_re.findall(text_lower)
             for match in matches:
                 if isinstance(match, tuple) and len(match) >= 2:
                     degree = match[0].strip().title()
@@ -147,8 +369,7 @@ class ResumeProcessor:
         
         # Extract from education section if no patterns matched
         if not education:
-            edu_section_pattern = r'education.*?(?:experience|skills|certifications|projects|achievements|$)'
-            edu_match = re.search(edu_section_pattern, text_lower, re.DOTALL)
+            edu_match = self._edu_section_re.search(text_lower)
             
             if edu_match:
                 edu_text = edu_match.group()
@@ -160,19 +381,15 @@ class ResumeProcessor:
                     # Skip section headers and very short lines
                     if len(line_clean) > 10 and len(line_clean) < 150:
                         # Skip if it's just a year or location
-                        if not re.match(r'^\d{4}(-\d{4})?$', line_clean):
+                        if not self._year_only_re.match(line_clean):
                             if not any(skip in line_clean.lower() for skip in ['education', 'degree', 'university', 'college', 'institute']):
                                 if any(c.isalpha() for c in line_clean):
                                     education.append(line_clean.title())
         
         # If still no education found, look for university/college names
         if not education:
-            university_patterns = [
-                r'([A-Z][a-zA-Z\s]+(?:University|College|Institute)[a-zA-Z\s]*)',
-            ]
-            
-            for pattern in university_patterns:
-                matches = re.findall(pattern, text)
+            for university_re in self._university_res:
+                matches = university_re.findall(text)
                 for match in matches[:3]:  # Limit to 3 universities
                     if isinstance(match, str) and len(match) > 10:
                         education.append(match.strip())
@@ -202,8 +419,7 @@ class ResumeProcessor:
         ]
         
         # Look for certification section
-        cert_section_pattern = r'certifications?.*?(?:education|experience|skills|projects|achievements|languages|$)'
-        cert_match = re.search(cert_section_pattern, text_lower, re.DOTALL)
+        cert_match = self._cert_section_re.search(text_lower)
         
         if cert_match:
             cert_text = cert_match.group()
@@ -215,24 +431,13 @@ class ResumeProcessor:
                 if any(keyword in line_clean.lower() for keyword in cert_keywords):
                     if 5 < len(line_clean) < 150:
                         # Skip section headers
-                        if not re.match(r'^certifications?:?$', line_clean.lower()):
+                        if not self._cert_header_re.match(line_clean.lower()):
                             if line_clean not in certifications:
                                 certifications.append(line_clean.title())
         
         # Also check for specific certification patterns anywhere in full text
-        specific_patterns = [
-            r'(aws\s+certified\s+[a-z\s\-]+(?:associate|professional|specialty)?)',
-            r'(microsoft\s+certified\s+[a-z\s\-]+)',
-            r'(google\s+cloud\s+[a-z\s\-]+(?:engineer|architect)?)',
-            r'(oracle\s+certified\s+[a-z\s\-]+)',
-            r'(cisco\s+certified\s+[a-z\s\-]+)',
-            r'(comptia\s+[a-z+]+)',
-            r'(certified\s+kubernetes\s+[a-z\s]+)',
-            r'(pmp|prince2|itil|cissp|ceh|ccna|ccnp|mcsa|mcse|rhce|cka|ckad)\s*(?:certified)?',
-        ]
-        
-        for pattern in specific_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
+        for certification_re in self._certification_res:
+            matches = certification_re.findall(text_lower)
             for match in matches:
                 cert = match if isinstance(match, str) else match[0]
                 cert_clean = cert.strip().title()
@@ -269,13 +474,16 @@ class ResumeProcessor:
             if not line:
                 continue
             
+            # Lower-cased once and shared by every helper below
+            line_lower = line.lower()
+            
             # Check if we're entering experience section
-            if self._is_experience_section_header(line):
+            if self._is_experience_section_header(line, line_lower):
                 in_experience_section = True
                 continue
             
             # Check if we're leaving experience section
-            if in_experience_section and self._is_new_section_header(line):
+            if in_experience_section and self._is_new_section_header(line, line_lower):
                 if current_experience:
                     experiences.append(self._finalize_experience(current_experience))
                     current_experience = {}
@@ -286,7 +494,7 @@ class ResumeProcessor:
                 continue
             
             # Look for company and role patterns
-            company_role = self._extract_company_role(line)
+            company_role = self._extract_company_role(line, line_lower)
             if company_role:
                 # Save previous experience if exists
                 if current_experience:
@@ -317,12 +525,13 @@ class ResumeProcessor:
             # Extract technologies and responsibilities from current line
             if current_experience:
                 # Extract technologies
-                techs = self._extract_technologies_from_line(line)
-                if techs:
-                    current_experience['technologies_used'].extend(techs)
+                if not self._skill_first_chars.isdisjoint(line_lower):
+                    techs = self._extract_technologies_from_line(line, line_lower)
+                    if techs:
+                        current_experience['technologies_used'].extend(techs)
                 
                 # Add as responsibility if it looks like one
-                if self._is_responsibility_line(line):
+                if self._is_responsibility_line(line, line_lower):
                     current_experience['responsibilities'].append(line)
         
         # Don't forget the last experience
@@ -366,25 +575,17 @@ class ResumeProcessor:
         if not text:
             return []
         
-        skills = set()
         text_lower = text.lower()
-        
-        # Extract from all skill categories
-        for category, skill_list in self.skill_categories.items():
-            for skill in skill_list:
-                # Use word boundaries to avoid partial matches
-                pattern = rf'\b{re.escape(skill.lower())}\b'
-                if re.search(pattern, text_lower):
-                    skills.add(skill)
+        skills = set(self._match_known_skills(text_lower))
         
         # Extract from dedicated skills section
-        skills_section_text = self._extract_skills_section(text)
+        skills_section_text = self._extract_skills_section(text, text_lower)
         if skills_section_text:
             section_skills = self._parse_skills_section(skills_section_text)
             skills.update(section_skills)
         
         # Extract from tech stack mentions
-        tech_stack_skills = self._extract_tech_stack_mentions(text)
+        tech_stack_skills = self._extract_tech_stack_mentions(text, text_lower)
         skills.update(tech_stack_skills)
         
         return list(skills)
@@ -419,40 +620,41 @@ class ResumeProcessor:
                     info['name'] = line
             
             # Extract email
-            email_match = re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', line)
+            email_match = self._email_re.search(line)
             if email_match and not info['email']:
                 info['email'] = email_match.group()
             
             # Extract phone
-            phone_match = re.search(r'[\+]?[1-9]?[\s\-]?[\(]?[0-9]{3}[\)]?[\s\-]?[0-9]{3}[\s\-]?[0-9]{4,6}', line)
+            phone_match = self._phone_re.search(line)
             if phone_match and not info['phone']:
                 info['phone'] = phone_match.group()
             
             # Extract LinkedIn
             if 'linkedin' in line.lower() and not info['linkedin']:
-                linkedin_match = re.search(r'linkedin\.com/in/[\w\-]+', line.lower())
+                linkedin_match = self._linkedin_re.search(line.lower())
                 if linkedin_match:
                     info['linkedin'] = linkedin_match.group()
             
             # Extract GitHub
             if 'github' in line.lower() and not info['github']:
-                github_match = re.search(r'github\.com/[\w\-]+', line.lower())
+                github_match = self._github_re.search(line.lower())
                 if github_match:
                     info['github'] = github_match.group()
         
         return info
     
-    def enhance_resume_data(self, raw_resume_data: dict) -> dict:
+    def enhance_resume_data(self, raw_resume_data: dict, *, inplace: bool = False) -> dict:
         """
         Post-process and enhance resume data
     
         Args:
             raw_resume_data: Raw resume data from processing
+            inplace: Update raw_resume_data directly instead of working on a copy
         
         Returns:
             Enhanced resume data with guaranteed skills array
         """
-        enhanced_data = raw_resume_data.copy()
+        enhanced_data = raw_resume_data if inplace else raw_resume_data.copy()
     
         # Ensure experience timeline exists and is properly formatted
         if 'experience_timeline' not in enhanced_data:
@@ -468,20 +670,23 @@ class ResumeProcessor:
         if 'skills' in enhanced_data:
             # Normalize skills to array format (handles string, dict, list, etc.)
             enhanced_data['skills'] = self.normalize_skills_to_array(enhanced_data['skills'])
-            enhanced_skills = set(enhanced_data['skills'])
-        
-            # Extract additional skills from experience descriptions
-            for exp in enhanced_data.get('experience_timeline', []):
-                exp_text = ' '.join([
-                    exp.get('role', ''),
-                    ' '.join(exp.get('responsibilities', [])),
-                    ' '.join(exp.get('technologies_used', []))
-                ])
-                additional_skills = self.extract_skills_from_text(exp_text)
-                enhanced_skills.update(additional_skills)
-        
-            # Convert back to list and ensure it's an array
-            enhanced_data['skills'] = list(enhanced_skills)
+        
+            # Extract additional skills from experience descriptions, scanning
+            # all entries as one text instead of one extraction per entry.
+            # Entries are separated by a blank line, where the skills-section
+            # and tech-stack patterns stop, so a match cannot run into the
+            # next entry. The skills may come from outside (e.g. LLM output),
+            # so this runs even when the original text is available
+            experience_text = '\n\n'.join(
+                '\n'.join([exp.get('role', ''), *exp.get('responsibilities', []), *exp.get('technologies_used', [])])
+                for exp in enhanced_data.get('experience_timeline', [])
+            )
+            experience_skills = self.extract_skills_from_text(experience_text)
+        
+            # Merge and de-duplicate, keeping the original skills first
+            enhanced_data['skills'] = list(dict.fromkeys(
+                chain(enhanced_data['skills'], experience_skills)
+            ))
         else:
             # If no skills key exists, ensure empty array
             enhanced_data['skills'] = []
@@ -525,61 +730,37 @@ class ResumeProcessor:
         if not skills:
             return []
     
-        # Already a list - just clean it
-        if isinstance(skills, list):
-            return [str(skill).strip() for skill in skills if skill and str(skill).strip()]
-    
-        # Handle dictionary format (e.g., {0: "Python", 1: "Java"})
-        if isinstance(skills, dict):
-            return [str(v).strip() for v in skills.values() if v and str(v).strip()]
-    
-        # Handle string format
-        if isinstance(skills, str):
-            # Try splitting by comma first
-            skill_list = [s.strip() for s in skills.split(',') if s.strip()]
-        
-            # If no commas found, try other delimiters
-            if len(skill_list) == 1:
-                for delimiter in ['|', ';', '/', '\n', '•', '-']:
-                    if delimiter in skills:
-                        skill_list = [s.strip() for s in skills.split(delimiter) if s.strip()]
-                        break
-        
-            return skill_list
-    
-        # For any other type, try to convert to string and return as single-item list
-        try:
-            skill_str = str(skills).strip()
-            return [skill_str] if skill_str else []
-        except:
-            return []
+        return _skill_normalizer_for(skills)(skills)
     
     # Helper methods
-    def _is_experience_section_header(self, line: str) -> bool:
+    def _is_experience_section_header(self, line: str, line_lower: Optional[str] = None) -> bool:
         """Check if line is an experience section header"""
-        line_lower = line.lower().strip()
+        if line_lower is None:
+            line_lower = line.lower().strip()
         return any(indicator in line_lower for indicator in self.experience_indicators)
     
-    def _is_new_section_header(self, line: str) -> bool:
+    def _is_new_section_header(self, line: str, line_lower: Optional[str] = None) -> bool:
         """Check if line starts a new section (not experience)"""
         section_headers = [
             'education', 'skills', 'projects', 'certifications', 'achievements',
             'awards', 'publications', 'languages', 'interests', 'references'
         ]
-        line_lower = line.lower().strip()
+        if line_lower is None:
+            line_lower = line.lower().strip()
         return any(header in line_lower for header in section_headers)
     
-    def _extract_company_role(self, line: str) -> Optional[Dict]:
+    def _extract_company_role(self, line: str, line_lower: Optional[str] = None) -> Optional[Dict]:
         """Extract company and role from a line"""
+        if line_lower is None:
+            line_lower = line.lower()
+        
         # Pattern 1: "Software Engineer at Google Inc."
-        at_pattern = r'(.+?)\s+at\s+(.+?)(?:\s*,|\s*$)'
-        match = re.search(at_pattern, line, re.IGNORECASE)
+        match = self._at_re.search(line) if 'at' in line_lower else None
         if match:
             return {'role': match.group(1).strip(), 'company': match.group(2).strip()}
         
         # Pattern 2: "Google Inc. - Software Engineer"
-        dash_pattern = r'(.+?)\s*[-–]\s*(.+?)(?:\s*,|\s*$)'
-        match = re.search(dash_pattern, line)
+        match = self._dash_re.search(line) if '-' in line or '–' in line else None
         if match:
             part1, part2 = match.group(1).strip(), match.group(2).strip()
             # Determine which is company vs role based on common patterns
@@ -591,7 +772,7 @@ class ResumeProcessor:
                 return {'role': part1, 'company': part2}
         
         # Pattern 3: Just role or company (need more context)
-        if any(indicator in line.lower() for indicator in self.role_indicators):
+        if any(indicator in line_lower for indicator in self.role_indicators):
             return {'role': line.strip(), 'company': ''}
         
         return None
@@ -614,11 +795,9 @@ class ResumeProcessor:
     
     def _extract_duration_from_line(self, line: str) -> str:
         """Extract duration from a line"""
-        for pattern in self.duration_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                return line.strip()
-        return ''
+        if not self._duration_trigger_re.search(line):
+            return ''
+        return line.strip() if self._duration_union_re.search(line) else ''
     
     def _parse_duration_to_months(self, duration: str) -> int:
         """Convert duration string to months"""
@@ -627,33 +806,50 @@ class ResumeProcessor:
         
         duration = duration.lower().strip()
         
+        # Collect every component in one scan, then apply the rules below in
+        # order of precedence
+        is_ongoing = False
+        years_value = None
+        months_value = None
+        year_matches = []
+        month_year_matches = []
+        for match in self._duration_parts_re.finditer(duration):
+            kind = match.lastgroup
+            if kind == 'years':
+                if years_value is None:
+                    years_value = match.group('years')
+            elif kind == 'months':
+                if months_value is None:
+                    months_value = match.group('months')
+            elif kind == 'my_year':
+                month_year_matches.append((match.group('my_month'), match.group('my_year')))
+                year_matches.append(match.group('my_year'))
+            elif kind == 'year':
+                year_matches.append(match.group('year'))
+            else:
+                is_ongoing = True
+        
         # Handle "present" or "current"
-        if 'present' in duration or 'current' in duration:
-            # Extract start date and calculate to present
-            year_matches = re.findall(r'\b(\d{4})\b', duration)
-            if year_matches:
-                start_year = int(year_matches[0])
-                current_year = datetime.now().year
-                return max(1, (current_year - start_year) * 12)
+        if is_ongoing and year_matches:
+            # Calculate from the start year to present
+            start_year = int(year_matches[0])
+            current_year = datetime.now().year
+            return max(1, (current_year - start_year) * 12)
         
         # Handle explicit years/months
-        years_match = re.search(r'(\d+(?:\.\d+)?)\s*years?', duration)
-        if years_match:
-            return int(float(years_match.group(1)) * 12)
+        if years_value is not None:
+            return int(float(years_value) * 12)
         
-        months_match = re.search(r'(\d+)\s*months?', duration)
-        if months_match:
-            return int(months_match.group(1))
+        if months_value is not None:
+            return int(months_value)
         
         # Handle year ranges
-        year_matches = re.findall(r'\b(\d{4})\b', duration)
         if len(year_matches) >= 2:
             start_year = int(year_matches[0])
             end_year = int(year_matches[-1])
             return max(1, (end_year - start_year) * 12)
         
         # Handle month-year patterns
-        month_year_matches = re.findall(r'(\d{1,2})/(\d{4})', duration)
         if len(month_year_matches) >= 2:
             start_month, start_year = month_year_matches[0]
             end_month, end_year = month_year_matches[-1]
@@ -663,44 +859,42 @@ class ResumeProcessor:
         
         return 6  # Default 6 months if unparseable
     
-    def _extract_technologies_from_line(self, line: str) -> List[str]:
+    def _match_known_skills(self, text_lower: str) -> List[str]:
+        """Find catalogue skills mentioned in already lower-cased text"""
+        matched = {}
+        for end, skill in self._skill_automaton.iter(text_lower):
+            # Use word boundaries to avoid partial matches
+            if _is_word_boundary(text_lower, end - len(skill) + 1, end):
+                matched[skill] = None
+        return list(matched)
+    
+    def _extract_technologies_from_line(self, line: str, line_lower: Optional[str] = None) -> List[str]:
         """Extract technologies mentioned in a line"""
-        technologies = []
-        line_lower = line.lower()
-        
-        # Check all skill categories
-        for category, skills in self.skill_categories.items():
-            for skill in skills:
-                if f' {skill} ' in f' {line_lower} ' or line_lower.startswith(skill) or line_lower.endswith(skill):
-                    technologies.append(skill)
-        
-        return technologies
+        if line_lower is None:
+            line_lower = line.lower()
+        return self._match_known_skills(line_lower)
     
-    def _is_responsibility_line(self, line: str) -> bool:
+    def _is_responsibility_line(self, line: str, line_lower: Optional[str] = None) -> bool:
         """Check if line describes a responsibility"""
         line = line.strip()
         
-        # Common responsibility indicators
-        responsibility_indicators = [
-            '•', '◦', '-', '*', '→',  # Bullet points
-            'developed', 'built', 'created', 'designed', 'implemented',
-            'managed', 'led', 'coordinated', 'maintained', 'optimized',
-            'collaborated', 'worked', 'responsible', 'achieved'
-        ]
+        # Short lines never count, so skip the indicator scan for them
+        if len(line) <= 20:
+            return False
         
-        line_lower = line.lower()
-        return any(indicator in line_lower for indicator in responsibility_indicators) and len(line) > 20
+        if line_lower is None:
+            line_lower = line.lower()
+        return bool(self._responsibility_re.search(line_lower))
     
-    def _extract_skills_section(self, text: str) -> str:
+    def _extract_skills_section(self, text: str, text_lower: Optional[str] = None) -> str:
         """Extract the skills section from resume text"""
-        skills_patterns = [
-            r'(?:technical\s+skills|skills|technologies|tech\s+stack|core\s+competencies)[:\s]+(.*?)(?=\n\n|\n[A-Z][A-Z\s]+:|\Z)',
-            r'(?:programming\s+languages|languages)[:\s]+(.*?)(?=\n\n|\n[A-Z][A-Z\s]+:|\Z)',
-            r'(?:tools\s+and\s+technologies|tools)[:\s]+(.*?)(?=\n\n|\n[A-Z][A-Z\s]+:|\Z)'
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for pattern in skills_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for keywords, section_re in self._skills_section_res:
+            if not any(keyword in text_lower for keyword in keywords):
+                continue
+            match = section_re.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -710,36 +904,52 @@ class ResumeProcessor:
         """Parse skills from skills section text"""
         skills = []
         
-        # Split by common delimiters
-        delimiters = [',', '|', ';', '•', '-', '\n']
-        text = skills_text
-        
-        for delimiter in delimiters:
-            text = text.replace(delimiter, ',')
-        
-        # Extract individual skills
-        potential_skills = [s.strip() for s in text.split(',') if s.strip()]
+        # Delimiters and stray punctuation never form part of a token, so a
+        # single sweep yields already-clean skills
+        for match in self._skill_token_re.finditer(skills_text):
+            for skill in self._split_skill_run(match.group().lower()):
+                # Filter out non-skills
+                if len(skill) > 1 and not skill.isdigit():
+                    skills.append(skill)
         
-        for skill in potential_skills:
-            # Clean up the skill
-            skill = re.sub(r'[^\w\s+#.-]', '', skill)
-            skill = skill.strip()
-            
-            # Filter out non-skills
-            if len(skill) > 1 and not skill.isdigit():
-                skills.append(skill.lower())
+        return skills
+    
+    def _split_skill_run(self, run: str) -> List[str]:
+        """Split a space-separated run into catalogue skills when it is made
+        up entirely of them ("python java go" -> 3 skills, "react native
+        flutter" -> 2); any other run is one multi-word skill ("amazon web
+        services cloud", "machine learning")"""
+        words = run.split()
+        if len(words) == 1:
+            return [run]
         
+        skills = []
+        i = 0
+        while i < len(words):
+            # Longest catalogue skill starting at this word
+            for size in range(min(self._max_skill_words, len(words) - i), 0, -1):
+                candidate = ' '.join(words[i:i + size])
+                if candidate in self._known_skills:
+                    skills.append(candidate)
+                    i += size
+                    break
+            else:
+                return [' '.join(words)]
         return skills
     
-    def _extract_tech_stack_mentions(self, text: str) -> List[str]:
+    def _extract_tech_stack_mentions(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Extract skills from tech stack mentions"""
-        tech_stack_pattern = r'tech\s+stack[:\s]+(.*?)(?=\n\n|\n[A-Z]|\Z)'
-        matches = re.findall(tech_stack_pattern, text, re.IGNORECASE | re.DOTALL)
+        if text_lower is None:
+            text_lower = text.lower()
+        if 'stack' not in text_lower:
+            return []
+        
+        matches = self._tech_stack_re.findall(text)
         
         skills = []
         for match in matches:
             # Split by common delimiters and extract skills
-            potential_skills = re.split(r'[,|;•\-\n]+', match)
+            potential_skills = self._tech_stack_split_re.split(match)
             for skill in potential_skills:
                 skill = skill.strip().lower()
                 if len(skill) > 1 and not skill.isdigit():
@@ -749,9 +959,9 @@ class ResumeProcessor:
     
     def _finalize_experience(self, experience: Dict) -> Dict:
         """Clean up and finalize an experience entry"""
-        # Remove duplicates from technologies
+        # Remove duplicates from technologies, keeping first-mention order
         if 'technologies_used' in experience:
-            experience['technologies_used'] = list(set(experience['technologies_used']))
+            experience['technologies_used'] = list(dict.fromkeys(experience['technologies_used']))
         
         # Ensure all required fields exist
         required_fields = ['company', 'role', 'duration', 'technologies_used', 'responsibilities']
@@ -762,6 +972,33 @@ class ResumeProcessor:
         return experience
 
 
+# Singleton instance; the processor only holds read-only pattern state
+# (class-level tables and regexes compiled once in __init__), so one instance
+# per process can serve every request and every process_batch worker
+_resume_processor: Optional[ResumeProcessor] = None
+
+
+def _process_one(file_content: bytes) -> Dict:
+    """Extract and parse a single resume inside a process_batch worker"""
+    processor = create_resume_processor()
+    
+    text = processor.extract_text_from_pdf(file_content)
+    experience_timeline = processor.parse_experience_timeline(text)
+    
+    resume_data = processor.extract_personal_info(text)
+    resume_data.update({
+        'skills': processor.extract_skills_from_text(text),
+        'experience_timeline': experience_timeline,
+        'total_experience': processor.calculate_total_experience(experience_timeline),
+        'original_text': text
+    })
+    
+    return processor.enhance_resume_data(resume_data, inplace=True)
+
+
 def create_resume_processor() -> 'ResumeProcessor':
-    """Create and return a ResumeProcessor instance"""
-    return ResumeProcessor()
\ No newline at end of file
+    """Get or create the shared ResumeProcessor instance"""
+    global _resume_processor
+    if _resume_processor is None:
+        _resume_processor = ResumeProcessor()
+    return _resume_processor
@@ -0,0 +1,13 @@
+# Living in the project root, this conftest makes `backend.app` importable from
+# the tests: pytest's default (prepend) import mode puts the directory of each
+# conftest.py it loads on sys.path. It does not set pytest's rootdir.
+import asyncio
+import sys
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop like the server does (asyncio on Windows)"""
+    if sys.platform == "win32":
+        return {"asyncio": asyncio.new_event_loop}
+    import uvloop
+    return {"uvloop": uvloop.new_event_loop}
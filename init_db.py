@@ -23,15 +23,18 @@ def init_database():
     
     db = SessionLocal()
     try:
-        users_created = 0
+        new_users = []
         users_skipped = 0
         
+        # Looking up every configured username in a single query
+        existing_usernames = {
+            username for (username,) in db.query(User.username).filter(
+                User.username.in_([user_data['username'] for user_data in default_users])
+            ).all()
+        }
+        
         for user_data in default_users:
-            existing_user = db.query(User).filter(
-                User.username == user_data['username']
-            ).first()
-            
-            if existing_user:
+            if user_data['username'] in existing_usernames:
                 print(f"User '{user_data['username']}' already exists - skipping")
                 users_skipped += 1
                 continue
@@ -44,11 +47,14 @@ def init_database():
             )
             new_user.set_password(user_data['password'])
             
-            db.add(new_user)
-            users_created += 1
+            new_users.append(new_user)
+            existing_usernames.add(user_data['username'])
             print(f"Created user: {user_data['username']} ({user_data['role']})")
         
+        # Inserting all new users in one bulk pass instead of per-object adds
+        db.bulk_save_objects(new_users)
         db.commit()
+        users_created = len(new_users)
         
         print(f"\nSummary:")
         print(f"   • Users created: {users_created}")
@@ -1,40 +1,81 @@
 import uvicorn
+import importlib.util
+import logging
 import os
 import sys
 from dotenv import load_dotenv
 
-# Loading environment variables
+# Loading environment variables. This stays a plain load_dotenv(): it finds
+# .env from this script's directory rather than the working directory, and
+# backend.app.config and backend.app.models.database load .env again on
+# import in every process anyway, so a load-once guard here would save
+# nothing. It never overrides variables already set in the environment
 load_dotenv()
 
-# Adding the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Configuring logging once; uvicorn is told to use it (log_config=None) rather
+# than install its own handlers, and uvicorn's spawned workers re-run this
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+log = logging.getLogger(__name__)
+
+# Console label for each DATABASE_URL scheme
+DATABASE_LABELS = {
+    "postgresql": "PostgreSQL (Production Ready)",
+    "postgres": "PostgreSQL (Production Ready)",
+    "sqlite": "SQLite (Development Mode)",
+}
+
+# uvloop has no Windows build, so the stock asyncio loop is used there
+EVENT_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
 
 def main():
     # Ensuring data directories exist
-    os.makedirs("./data/uploads/jds", exist_ok=True)
-    os.makedirs("./data/uploads/resumes", exist_ok=True)
-    os.makedirs("./data/processed", exist_ok=True)
+    for path in ("./data/uploads/jds", "./data/uploads/resumes", "./data/processed"):
+        os.makedirs(path, exist_ok=True)
     
-    print("Starting SentientGeeks ATS Resume Matcher...")
+    # Checking database type from the DATABASE_URL scheme, ignoring any
+    # SQLAlchemy driver suffix such as postgresql+psycopg2
+    scheme = os.getenv("DATABASE_URL", "").split(":", 1)[0].split("+", 1)[0].lower()
+    db_label = DATABASE_LABELS.get(scheme, "Unknown")
     
-    # Checking database type from environment
-    database_url = os.getenv("DATABASE_URL", "")
-    if "postgresql" in database_url.lower():
-        print("Database: PostgreSQL (Production Ready)")
-    elif "sqlite" in database_url.lower():
-        print("Database: SQLite (Development Mode)")
-    else:
-        print("Database: Unknown")
+    # Logging the banner as one record; the handler flushes it, so nothing is
+    # lost when the gunicorn exec below replaces the process
+    log.info(
+        "Starting SentientGeeks ATS Resume Matcher...\n"
+        f"Database: {db_label}\n"
+        "Server will be available at: http://localhost:8000"
+    )
     
-    print("Server will be available at: http://localhost:8000")
+    # Running the application under gunicorn with a uvicorn worker, preloading
+    # the app so models load once in the master; gunicorn is POSIX-only, so
+    # elsewhere uvicorn serves it. Login sessions live in a per-process dict
+    # (user_routes.active_sessions), so this stays at one worker until they
+    # move to a shared store. Launched through this interpreter so gunicorn
+    # runs in the same environment as run.py
+    if importlib.util.find_spec("gunicorn") and importlib.util.find_spec("uvicorn_worker"):
+        os.execv(sys.executable, [
+            sys.executable, "-m", "gunicorn", "backend.app.main:app",
+            "--preload",
+            "-k", "uvicorn_worker.UvicornWorker",
+            "-w", "1",
+            "-b", "127.0.0.1:8000",
+            "--keep-alive", "5",
+            "--timeout", "120",
+            "--access-logfile", "/dev/null",
+            "--error-logfile", "-",
+            "--log-level", "warning"
+        ])
     
-    # Running the application
     uvicorn.run(
         "backend.app.main:app",
         host="127.0.0.1",
         port=8000,
         reload=False,
-        log_level="info"
+        log_level="warning",
+        log_config=None,
+        access_log=False,
+        loop=EVENT_LOOP,
+        http="httptools",
+        workers=1  # sessions are per-process, see the gunicorn note above
     )
 
 if __name__ == "__main__":
@@ -1,37 +1,28 @@
+"""
+End-to-end checks for the agentic AI service against a live LLM backend.
+
+Run from the project root with ``pytest tests/test_agentic.py
+--log-cli-level=INFO`` to see the output; needs the requirements installed
+and the API key of the configured LLM backend set in .env (PERPLEXITY_API_KEY
+by default, GROQ_API_KEY or OPENAI_API_KEY when USE_PERPLEXITY=false). The
+tests are skipped when that key is missing. The service and the LLM analyses
+are module-scoped fixtures, so each is built once per run.
+Set VERBOSE_TESTS=1 to also log the full JSON of each result.
+"""
 import asyncio
-import json
-import sys
+import logging
 import os
-import traceback
 
-# Add project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import orjson
+import pytest
+import pytest_asyncio
 
-from backend.app.services.agentic_service import EnhancedAgenticATSService
+RULE = "=" * 70
+THIN_RULE = "-" * 70
 
+log = logging.getLogger(__name__)
 
-async def test_agentic_service():
-    """Test all agentic AI functionalities"""
-    
-    print("\n" + "=" * 70)
-    print("🚀 AGENTIC AI SERVICE TEST")
-    print("=" * 70)
-    
-    try:
-        # Initialize service
-        print("\n📦 Initializing Agentic AI Service...")
-        service = EnhancedAgenticATSService()
-        print("✅ Service initialized successfully!\n")
-    except Exception as e:
-        print(f"❌ Failed to initialize service: {e}")
-        print("\n💡 Make sure you have:")
-        print("   1. Installed dependencies: pip install -r requirements.txt")
-        print("   2. Set GROQ_API_KEY in .env file")
-        traceback.print_exc()
-        return
-    
-    # Sample resume
-    sample_resume = """
+SAMPLE_RESUME = """
     John Doe
     Email: john.doe@example.com
     Phone: +91-9876543210
@@ -64,9 +55,8 @@ async def test_agentic_service():
     - AWS Certified Solutions Architect
     - Python Professional Certification
     """
-    
-    # Sample job description
-    sample_jd = """
+
+SAMPLE_JD = """
     Senior Python Developer
     Accenture India - Bangalore
     
@@ -104,101 +94,146 @@ async def test_agentic_service():
     
     JOB TYPE: Full-time
     """
-    
-    # Test 1: Resume Analysis
-    print("=" * 70)
-    print("TEST 1: Resume Analysis")
-    print("=" * 70)
-    try:
-        resume_result = await service.analyze_resume(sample_resume)
-        print("\n✅ Resume Analysis Completed!")
-        print("\n📄 Extracted Information:")
-        print(json.dumps(resume_result, indent=2))
-    except Exception as e:
-        print(f"\n❌ Resume Analysis Failed: {e}")
-        traceback.print_exc()
-        return
-    
-    # Test 2: Job Description Analysis
-    print("\n" + "=" * 70)
-    print("TEST 2: Job Description Analysis")
-    print("=" * 70)
-    try:
-        jd_result = await service.analyze_job_description(sample_jd)
-        print("\n✅ JD Analysis Completed!")
-        print("\n📋 Extracted Information:")
-        print(json.dumps(jd_result, indent=2))
-    except Exception as e:
-        print(f"\n❌ JD Analysis Failed: {e}")
-        traceback.print_exc()
-        return
-    
-    # Test 3: Matching & Scoring
-    print("\n" + "=" * 70)
-    print("TEST 3: Comprehensive Matching & Scoring")
-    print("=" * 70)
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+def log_json(title, data):
+    """Pretty-print a result, only when VERBOSE_TESTS is set"""
+    if os.getenv("VERBOSE_TESTS"):
+        log.info("%s\n%s", title, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode())
+
+
+def llm_api_key_name():
+    """Env var holding the API key of the backend EnhancedAgenticATSService picks"""
+    if os.getenv("USE_PERPLEXITY", "true").lower() == "true":
+        return "PERPLEXITY_API_KEY"
+    if os.getenv("USE_GROQ", "true").lower() == "true":
+        return "GROQ_API_KEY"
+    return "OPENAI_API_KEY"
+
+
+@pytest.fixture(scope="module")
+def service():
+    """One agentic service shared by every test in the module"""
+    log.info(f"\n{RULE}\n🚀 AGENTIC AI SERVICE TEST\n{RULE}")
+    log.info("\n📦 Initializing Agentic AI Service...")
     try:
-        matching_result = await service.match_and_score(resume_result, jd_result)
-        print("\n✅ Matching & Scoring Completed!")
-        print("\n🎯 Matching Results:")
-        print(json.dumps(matching_result, indent=2))
-        
-        # Display summary
-        print("\n" + "-" * 70)
-        print("📊 SUMMARY")
-        print("-" * 70)
-        print(f"Overall Score: {matching_result.get('overall_score', 'N/A')}/100")
-        print(f"Recommendation: {matching_result.get('recommendation', 'N/A')}")
-        print(f"\nStrengths:")
-        for strength in matching_result.get('strengths', [])[:3]:
-            print(f"  ✓ {strength}")
-        print(f"\nWeaknesses:")
-        for weakness in matching_result.get('weaknesses', [])[:3]:
-            print(f"  ✗ {weakness}")
+        # Importing the service loads .env, so check the key afterwards
+        from backend.app.services.agentic_service import EnhancedAgenticATSService
     except Exception as e:
-        print(f"\n❌ Matching & Scoring Failed: {e}")
-        traceback.print_exc()
-        return
-    
-    # Test 4: Interview Questions Generation
-    print("\n" + "=" * 70)
-    print("TEST 4: Interview Questions Generation")
-    print("=" * 70)
+        pytest.skip(f"Agentic AI service unavailable ({e}); install requirements.txt")
+    # The LLM client accepts a missing key and only fails on the first call
+    key_name = llm_api_key_name()
+    if not os.getenv(key_name):
+        pytest.skip(f"{key_name} is not set; add it to .env to run the agentic tests")
     try:
-        questions = await service.generate_interview_questions(
-            resume_result, 
-            jd_result, 
-            difficulty="medium",
-            num_questions=5
-        )
-        print("\n✅ Interview Questions Generated!")
-        print(f"\n💬 Generated {len(questions)} Questions:\n")
-        for i, q in enumerate(questions, 1):
-            print(f"{i}. [{q.get('category', 'General')}] {q.get('question', 'N/A')}")
-            print(f"   Skill Tested: {q.get('skill_tested', 'N/A')}")
-            print(f"   Difficulty: {q.get('difficulty', 'N/A')}\n")
+        service = EnhancedAgenticATSService()
     except Exception as e:
-        print(f"\n❌ Interview Questions Generation Failed: {e}")
-        traceback.print_exc()
-    
-    # Final Summary
-    print("\n" + "=" * 70)
-    print("✅ ALL TESTS COMPLETED SUCCESSFULLY!")
-    print("=" * 70)
-    print("\n🎉 Agentic AI Service is working perfectly!")
-    print("\n💡 Next Steps:")
-    print("   1. Update .env: SET USE_AGENTIC_AI=true")
-    print("   2. Start server: python run.py")
-    print("   3. Test via UI at http://localhost:8000")
-    print("\n" + "=" * 70)
-
-
-if __name__ == "__main__":
-    print("\n🧪 Starting Agentic AI Service Tests...")
+        pytest.skip(f"Agentic AI service unavailable ({e})")
+    log.info("✅ Service initialized successfully!\n")
+    return service
+
+
+@pytest.fixture(scope="module")
+def interview_service():
+    """Interview question generator, the service the interview API uses"""
     try:
-        asyncio.run(test_agentic_service())
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Test interrupted by user")
+        from backend.app.services.interview_service import InterviewService
+        return InterviewService()
     except Exception as e:
-        print(f"\n\n❌ Fatal error: {e}")
-        traceback.print_exc()
\ No newline at end of file
+        pytest.skip(f"Interview service unavailable ({e})")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def analyses(service):
+    # Resume and JD analysis are independent LLM calls, so run them together
+    return await asyncio.gather(
+        service.analyze_resume(SAMPLE_RESUME),
+        service.analyze_job_description(SAMPLE_JD),
+        return_exceptions=True
+    )
+
+
+@pytest.fixture(scope="module")
+def resume_result(analyses):
+    if isinstance(analyses[0], Exception):
+        raise analyses[0]
+    return analyses[0]
+
+
+@pytest.fixture(scope="module")
+def jd_result(analyses):
+    if isinstance(analyses[1], Exception):
+        raise analyses[1]
+    return analyses[1]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def evaluations(service, interview_service, resume_result, jd_result):
+    # Matching and question generation only read the analyses, so they can
+    # run together too
+    return await asyncio.gather(
+        service.match_and_score(jd_data=jd_result, resume_data=resume_result),
+        interview_service.generate_interview_questions(jd_result, difficulty_level="medium"),
+        return_exceptions=True
+    )
+
+
+@pytest.fixture(scope="module")
+def matching_result(evaluations):
+    if isinstance(evaluations[0], Exception):
+        raise evaluations[0]
+    return evaluations[0]
+
+
+@pytest.fixture(scope="module")
+def questions(evaluations):
+    if isinstance(evaluations[1], Exception):
+        raise evaluations[1]
+    return evaluations[1]
+
+
+async def test_resume_analysis(resume_result):
+    log.info(f"{RULE}\nTEST 1: Resume Analysis\n{RULE}")
+    log.info("\n✅ Resume Analysis Completed!")
+    log_json("\n📄 Extracted Information:", resume_result)
+    
+    assert isinstance(resume_result.get("skills"), list)
+
+
+async def test_job_description_analysis(jd_result):
+    log.info(f"\n{RULE}\nTEST 2: Job Description Analysis\n{RULE}")
+    log.info("\n✅ JD Analysis Completed!")
+    log_json("\n📋 Extracted Information:", jd_result)
+    
+    assert isinstance(jd_result, dict)
+
+
+async def test_matching_and_scoring(matching_result):
+    log.info(f"\n{RULE}\nTEST 3: Comprehensive Matching & Scoring\n{RULE}")
+    log.info("\n✅ Matching & Scoring Completed!")
+    log_json("\n🎯 Matching Results:", matching_result)
+    
+    # Display summary
+    log.info(f"\n{THIN_RULE}\n📊 SUMMARY\n{THIN_RULE}")
+    log.info(f"Overall Score: {matching_result.get('overall_score', 'N/A')}/100")
+    log.info(f"Recommendation: {matching_result.get('recommendation', 'N/A')}")
+    log.info(f"\nStrengths:")
+    for strength in matching_result.get('strengths', [])[:3]:
+        log.info(f"  ✓ {strength}")
+    log.info(f"\nWeaknesses:")
+    for weakness in matching_result.get('weaknesses', [])[:3]:
+        log.info(f"  ✗ {weakness}")
+    
+    assert "overall_score" in matching_result
+
+
+async def test_interview_questions(questions):
+    log.info(f"\n{RULE}\nTEST 4: Interview Questions Generation\n{RULE}")
+    log.info("\n✅ Interview Questions Generated!")
+    log.info(f"\n💬 Generated {len(questions)} Questions:\n")
+    for i, question in enumerate(questions, 1):
+        log.info(f"{i}. {question}")
+    
+    assert questions and all(isinstance(q, str) for q in questions)
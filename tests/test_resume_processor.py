@@ -0,0 +1,222 @@
+"""
+Regression tests for the rule-based resume parser.
+
+These pin the parsing behaviour of ResumeProcessor so changes to its
+regexes and matching code can be checked against known outputs.
+"""
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+import pytest
+
+from backend.app.services.resume_processor import ResumeProcessor
+
+
+@pytest.fixture(scope="module")
+def processor():
+    return ResumeProcessor()
+
+
+@pytest.mark.parametrize("duration, months", [
+    ("Jan 2020 - Dec 2022", 24),
+    ("01/2020 - 06/2021", 12),
+    ("2018 - 2020", 24),
+    ("2 years", 24),
+    ("1.5 years", 18),
+    ("3 years 6 months", 36),
+    ("18 months", 18),
+    ("2019", 6),
+    ("garbage", 6),
+    ("", 0),
+])
+def test_parse_duration_to_months(processor, duration, months):
+    assert processor._parse_duration_to_months(duration) == months
+
+
+def test_parse_duration_to_months_ongoing(processor):
+    expected = (datetime.now().year - 2020) * 12
+    assert processor._parse_duration_to_months("Jan 2020 - Present") == expected
+    assert processor._parse_duration_to_months("2020 - current") == expected
+
+
+def test_enhance_resume_data_total_experience(processor):
+    raw = {
+        "skills": [],
+        "experience_timeline": [
+            {"duration": "Jan 2018 - Dec 2020"},
+            {"duration": "18 months"},
+        ],
+    }
+    enhanced = processor.enhance_resume_data(raw)
+
+    assert enhanced["total_experience"] == 3.5
+
+
+def _make_pdf(text):
+    fitz = pytest.importorskip("fitz")
+    with fitz.open() as doc:
+        doc.new_page().insert_text((72, 72), text)
+        return doc.tobytes()
+
+
+def test_process_batch_keeps_order_and_survives_bad_input():
+    files = [
+        _make_pdf("Jane Roe\njane@example.com\nSkills: Python, Docker"),
+        b"not a pdf",
+        _make_pdf("John Doe\nSkills: Java"),
+    ]
+    results = ResumeProcessor.process_batch(files)
+
+    assert [sorted(r["skills"]) for r in results] == [["docker", "python"], [], ["java"]]
+    assert results[0]["email"] == "jane@example.com"
+    # An unreadable file yields an empty resume rather than an exception
+    assert results[1]["original_text"] == ""
+    assert results[1]["experience_timeline"] == []
+    assert ResumeProcessor.process_batch([]) == []
+
+
+def test_enhance_resume_data_defaults(processor):
+    enhanced = processor.enhance_resume_data({})
+
+    assert enhanced["skills"] == []
+    assert enhanced["experience_timeline"] == []
+    assert enhanced["total_experience"] == 0.0
+    assert enhanced["education"] == ["No education information available"]
+    assert enhanced["certifications"] == ["No certifications available"]
+
+
+def test_enhance_resume_data_copy_or_inplace(processor):
+    raw = {"skills": "Python, Docker"}
+
+    # Works on a copy unless asked to update in place
+    copied = processor.enhance_resume_data(raw)
+    assert copied is not raw
+    assert raw["skills"] == "Python, Docker"
+
+    updated = processor.enhance_resume_data(raw, inplace=True)
+    assert updated is raw
+    assert raw["skills"] == ["Python", "Docker"]
+
+
+def test_enhance_resume_data_merges_experience_skills(processor):
+    raw = {
+        "skills": "Python, Docker",
+        "experience_timeline": [{
+            "responsibilities": ["Managed clusters with kubernetes"],
+            "technologies_used": ["terraform"],
+        }],
+        "original_text": "x",
+    }
+    enhanced = processor.enhance_resume_data(raw)
+
+    # Given skills come first; experience skills follow in no fixed order
+    assert enhanced["skills"][:2] == ["Python", "Docker"]
+    assert sorted(enhanced["skills"][2:]) == ["kubernetes", "terraform"]
+
+
+@pytest.mark.parametrize("section, skills", [
+    ("Python, JavaScript, Node.js (Express), C++, C# | Go; Rust • CI/CD",
+     ["python", "javascript", "node.js", "express", "c++", "c#", "go", "rust", "ci", "cd"]),
+    ("Python\nDocker - Kubernetes", ["python", "docker", "kubernetes"]),
+    ("2019, Python, R", ["python"]),
+    # Runs made only of catalogue skills are split into them ...
+    ("Python Java Go Rust Kotlin", ["python", "java", "go", "rust", "kotlin"]),
+    ("React Native Flutter, Power BI Tableau", ["react native", "flutter", "power bi", "tableau"]),
+    # ... anything else stays one multi-word skill
+    ("Amazon Web Services Cloud, Machine Learning", ["amazon web services cloud", "machine learning"]),
+])
+def test_parse_skills_section(processor, section, skills):
+    assert processor._parse_skills_section(section) == skills
+
+
+@pytest.mark.parametrize("section, count", [
+    # Long runs of unknown words stay one token each ...
+    (("word " * 5000 + ", ") * 5, 5),
+    # ... and long runs of catalogue skills split in linear time
+    (("python java " * 2500 + ", ") * 5, 25000),
+])
+def test_parse_skills_section_long_input_is_fast(processor, section, count):
+    start = time.perf_counter()
+    skills = processor._parse_skills_section(section)
+    elapsed = time.perf_counter() - start
+
+    assert len(skills) == count
+    # Generous bound; a quadratic split of these runs takes far longer
+    assert elapsed < 1.0
+
+
+@pytest.mark.parametrize("raw, skills", [
+    (None, []),
+    ("", []),
+    ([], []),
+    (["Python", " Java ", "", None], ["Python", "Java"]),
+    ({0: "Python", 1: " Java", 2: ""}, ["Python", "Java"]),
+    (OrderedDict([(0, "Python"), (1, "Java")]), ["Python", "Java"]),
+    ("Python, Java", ["Python", "Java"]),
+    ("Python | Java", ["Python", "Java"]),
+    ("Python; Java", ["Python", "Java"]),
+    ("Python\nJava", ["Python", "Java"]),
+    ("Python", ["Python"]),
+    (42, ["42"]),
+    # Only the first delimiter present is split on
+    ("Python | scikit-learn", ["Python", "scikit-learn"]),
+    ("Python | scikit-learn | Node.js", ["Python", "scikit-learn", "Node.js"]),
+    ("CI/CD; Front-end", ["CI/CD", "Front-end"]),
+    ("Java/J2EE | Spring-Boot", ["Java/J2EE", "Spring-Boot"]),
+])
+def test_normalize_skills_to_array(processor, raw, skills):
+    assert processor.normalize_skills_to_array(raw) == skills
+
+
+def test_extract_skills_from_text(processor):
+    text = (
+        "John Doe\n"
+        "Built Android Studio plugins and React Native apps with Docker\n"
+        "\n"
+        "SKILLS:\n"
+        "Python Java, Machine Learning\n"
+    )
+    assert sorted(processor.extract_skills_from_text(text)) == [
+        "android", "android studio", "docker", "java", "machine learning",
+        "python", "react", "react native",
+    ]
+
+
+def test_extract_skills_from_text_word_boundaries(processor):
+    assert processor.extract_skills_from_text("Worked on javascript and golang") == ["javascript"]
+    assert sorted(processor.extract_skills_from_text("c++ and c# dev")) == ["c#", "c++"]
+    assert processor.extract_skills_from_text("") == []
+
+
+@pytest.mark.parametrize("line, technologies", [
+    ("Built APIs with Python, Docker and React Native", ["docker", "python", "react", "react native"]),
+    ("Worked in golang and javascript", ["javascript"]),
+    ("c++ / c# tools", ["c#", "c++"]),
+    ("Nothing here", []),
+])
+def test_extract_technologies_from_line(processor, line, technologies):
+    assert sorted(processor._extract_technologies_from_line(line)) == technologies
+
+
+def test_enhance_resume_data_keeps_experience_entries_apart(processor):
+    raw = {
+        "skills": ["Python"],
+        "experience_timeline": [
+            {
+                "role": "Engineer",
+                "responsibilities": ["Built internal tools for the team", "Skills: Go, Rust"],
+                "technologies_used": [],
+            },
+            {
+                "role": "Developer",
+                "responsibilities": ["Maintained legacy billing platform written in perl and java over many years"],
+                "technologies_used": ["mysql"],
+            },
+        ],
+    }
+    enhanced = processor.enhance_resume_data(raw)
+
+    # The first entry's skills section must not swallow the second entry
+    assert enhanced["skills"][0] == "Python"
+    assert sorted(enhanced["skills"][1:]) == ["go", "java", "mysql", "perl", "rust"]